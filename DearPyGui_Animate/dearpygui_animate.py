@@ -12,7 +12,12 @@ v0.12
 # 				Imports
 # -----------------------------------------------------------------------------
 
-import dearpygui.dearpygui as dpg
+import mmap
+import struct
+import sys
+import threading
+from array import array
+from concurrent.futures import Future, ProcessPoolExecutor
 
 # -----------------------------------------------------------------------------
 # 				Global Registers
@@ -22,6 +27,338 @@ animations = []
 delta_positions = []
 delta_sizes = []
 delta_opacities = []
+delta_series = []
+delta_refs = {}
+texture_buffers = {}
+alpha_pool_steps = 0
+alpha_themes = {}
+alpha_buckets = {}
+item_themes = {}
+deleted_items = set()
+staggers = []
+counters = {"active": 0, "pending": 0, "paused": 0, "finished": 0, "types": {}}
+subscribers = []
+pending_timelines = []
+pending_reflows = []
+timeline_executor = None
+culling = False
+culling_refresh = 0.25
+culling_checked = None
+item_windows = {}
+visible_windows = {}
+visible_items = {}
+culled_writes = {}
+recording = None
+backend = None
+
+# -----------------------------------------------------------------------------
+# 				Backends
+# -----------------------------------------------------------------------------
+
+class DearPyGuiBackend:
+    """
+    default backend, dearpygui is imported on first use
+    """
+
+    def __init__(self):
+        import dearpygui.dearpygui as dpg
+        self.dpg = dpg
+
+    def get_total_time(self):
+        return self.dpg.get_total_time()
+
+    def get_item_type(self, item):
+        return self.dpg.get_item_type(item)
+
+    def does_item_exist(self, item):
+        return self.dpg.does_item_exist(item)
+
+    def get_item_parent(self, item):
+        return self.dpg.get_item_parent(item)
+
+    def get_item_children(self, item):
+        return self.dpg.get_item_children(item, 1)
+
+    def get_item_pos(self, item):
+        return self.dpg.get_item_pos(item)
+
+    def reset_item_pos(self, item):
+        self.dpg.reset_pos(item)
+
+    def get_frame_count(self):
+        return self.dpg.get_frame_count()
+
+    def is_item_shown(self, item):
+        return self.dpg.is_item_shown(item)
+
+    def is_item_visible(self, item):
+        return self.dpg.is_item_shown(item) and self.dpg.is_item_visible(item)
+
+    def set_item_pos(self, item, pos):
+        self.dpg.set_item_pos(item, pos)
+
+    def set_item_size(self, item, size):
+        self.dpg.set_item_width(item, size[0])
+        self.dpg.set_item_height(item, size[1])
+
+    def get_item_value(self, item):
+        return self.dpg.get_value(item)
+
+    def set_item_series(self, item, x, y):
+        self.dpg.set_value(item, [x, y])
+
+    def add_raw_texture(self, width, height, buffer, parent, **kwargs):
+        return self.dpg.add_raw_texture(width, height, buffer, format=self.dpg.mvFormat_Float_rgba, parent=parent, **kwargs)
+
+    def set_item_opacity(self, item, opacity):
+        dpg = self.dpg
+
+        if dpg.get_item_type(item) == "mvAppItemType::mvText":
+            new_color = dpg.get_item_configuration(item)["color"]
+            new_color = list(map(lambda color: int(color * 255), new_color[:3:]))
+
+            new_color.append(opacity * 255)
+
+            dpg.configure_item(item, color=new_color)
+        else:
+            dpg.set_value(self.get_alpha_style(item), [opacity])
+
+    def get_alpha_style(self, item):
+        dpg = self.dpg
+
+        theme = dpg.get_item_theme(item)
+        if theme is None:
+            theme = dpg.add_theme()
+            theme_component = dpg.add_theme_component(dpg.mvAll, parent=theme)
+            alpha_style = dpg.add_theme_style(dpg.mvStyleVar_Alpha, 1, category=dpg.mvThemeCat_Core, parent=theme_component)
+            dpg.bind_item_theme(item, theme)
+            return alpha_style
+
+        all_components = dpg.get_item_children(theme, 1)
+        theme_component = None
+        for component in all_components:
+            if dpg.get_item_configuration(component)['item_type'] == dpg.mvAll:
+                theme_component = component
+                break
+        if theme_component is None:
+            theme_component = dpg.add_theme_component(parent=theme)
+
+        all_styles = dpg.get_item_children(theme_component, 1)
+        alpha_style = None
+        for style in all_styles:
+            if dpg.get_item_configuration(style)['target'] == dpg.mvStyleVar_Alpha:
+                alpha_style = style
+                break
+        if alpha_style is None:
+            alpha_style = dpg.add_theme_style(dpg.mvStyleVar_Alpha, 1, category=dpg.mvThemeCat_Core, parent=theme_component)
+        return alpha_style
+
+    def add_alpha_theme(self, alpha):
+        dpg = self.dpg
+
+        theme = dpg.add_theme()
+        theme_component = dpg.add_theme_component(dpg.mvAll, parent=theme)
+        dpg.add_theme_style(dpg.mvStyleVar_Alpha, alpha, category=dpg.mvThemeCat_Core, parent=theme_component)
+        return theme
+
+    def get_item_theme(self, item):
+        # 0 unbinds when the theme is bound back
+        return self.dpg.get_item_theme(item) or 0
+
+    def bind_item_theme(self, item, theme):
+        self.dpg.bind_item_theme(item, theme)
+
+    def fire_callback(self, item, name):
+        pass
+
+    def is_running(self):
+        return self.dpg.is_dearpygui_running()
+
+    def render_frame(self):
+        self.dpg.render_dearpygui_frame()
+
+
+class NullBackend:
+    """
+    headless backend, keeps item values in memory and records every write,
+    time only moves on advance()
+    """
+
+    def __init__(self, fps=60):
+        self.fps = fps
+        self.time = 0
+        self.frames = 0
+        self.running = True
+        self.item_types = {}
+        self.positions = {}
+        self.sizes = {}
+        self.opacities = {}
+        self.values = {}
+        self.parents = {}
+        self.children = {}
+        self.hidden = set()
+        self.clipped = set()
+        self.deleted = set()
+        self.themes = {}
+        self.writes = []
+
+    def advance(self, frames=1):
+        self.time += frames / self.fps
+        self.frames += frames
+
+    def delete_item(self, item):
+        self.deleted.add(item)
+
+    def get_total_time(self):
+        return self.time
+
+    def get_item_type(self, item):
+        return self.item_types.get(item, "")
+
+    def does_item_exist(self, item):
+        return item not in self.deleted
+
+    def get_item_parent(self, item):
+        return self.parents.get(item)
+
+    def get_item_children(self, item):
+        return self.children.get(item, [])
+
+    def get_item_pos(self, item):
+        return self.positions.get(item, [0, 0])
+
+    def reset_item_pos(self, item):
+        self.check_item(item)
+        self.writes.append(("reset", item, None))
+
+    def get_frame_count(self):
+        return self.frames
+
+    def is_item_shown(self, item):
+        return item not in self.hidden
+
+    def is_item_visible(self, item):
+        return item not in self.hidden and item not in self.clipped
+
+    def set_item_pos(self, item, pos):
+        self.check_item(item)
+        self.positions[item] = pos
+        self.writes.append(("position", item, pos))
+
+    def set_item_size(self, item, size):
+        self.check_item(item)
+        self.sizes[item] = size
+        self.writes.append(("size", item, size))
+
+    def set_item_opacity(self, item, opacity):
+        self.check_item(item)
+        self.opacities[item] = opacity
+        self.writes.append(("opacity", item, opacity))
+
+    def get_item_value(self, item):
+        return self.values.get(item)
+
+    def set_item_series(self, item, x, y):
+        self.check_item(item)
+        self.values[item] = [x, y]
+        self.writes.append(("series", item, [x, y]))
+
+    def add_raw_texture(self, width, height, buffer, parent, **kwargs):
+        tag = kwargs.get("tag", "texture_" + str(len(self.values)))
+        self.values[tag] = buffer
+        return tag
+
+    def get_alpha_style(self, item):
+        return None
+
+    def add_alpha_theme(self, alpha):
+        return alpha
+
+    def get_item_theme(self, item):
+        return self.themes.get(item, 0)
+
+    def bind_item_theme(self, item, theme):
+        self.check_item(item)
+        self.themes[item] = theme
+        # pooled alpha themes are their alpha value, an item's own theme is opaque
+        self.opacities[item] = theme if isinstance(theme, float) else 1.0
+        self.writes.append(("theme", item, theme))
+
+    def fire_callback(self, item, name):
+        self.writes.append(("callback", item, name))
+
+    def is_running(self):
+        return self.running
+
+    def render_frame(self):
+        self.advance()
+
+    def check_item(self, item):
+        if item in self.deleted:
+            raise KeyError("item " + str(item) + " was deleted")
+
+
+# -----------------------------------------------------------------------------
+# 				Handles
+# -----------------------------------------------------------------------------
+
+class AnimationHandle:
+    """
+    returned by add(..., handle=True), its futures resolve when the animation
+    starts, finishes or loops, awaiting the handle waits until it finishes
+    """
+
+    def __init__(self):
+        self.started = Future()
+        self.finished = Future()
+        self.looped = Future()
+
+    def __await__(self):
+        import asyncio
+        return asyncio.wrap_future(self.finished).__await__()
+
+    def wait(self, timeout=None):
+        return self.finished.result(timeout)
+
+    def next_loop(self):
+        return self.looped
+
+
+async def drive():
+    """
+    runs animations and renders one frame per iteration from an asyncio event loop,
+    so handles can be awaited by other tasks
+    """
+
+    import asyncio
+
+    gui = get_backend()
+
+    while gui.is_running():
+        run()
+        gui.render_frame()
+        await asyncio.sleep(0)
+
+
+def get_backend():
+    """
+    returns the active backend, dearpygui by default
+    """
+
+    global backend
+
+    if backend is None:
+        backend = DearPyGuiBackend()
+    return backend
+
+
+def set_backend(new_backend):
+    """
+    sets the backend all animations are read from and written to
+    """
+
+    global backend
+    backend = new_backend
 
 # -----------------------------------------------------------------------------
 # 				Main Functions
@@ -32,28 +369,72 @@ def add(type, object, startval, endval, ease, duration, **kwargs):
     adds a new animation to animations register
     """
 
-    # fix min-values: smallest size window = 32x32, smallest size item = 1x1
     if type == "size":
-        if dpg.get_item_type(object) == "mvAppItemType::Window":
-            for i in range(2):
-                if startval[i] < 32:
-                    startval[i] = 32
+        fix_min_size(object, startval, endval)
 
-                elif endval[i] < 32:
-                    endval[i] = 32
-        else:
-            for i in range(2):
-                if startval[i] < 1:
-                    startval[i] = 1
+    if type == "series":
+        startval, distance = get_series_distance(object, startval, endval)
+    elif type == "texture":
+        startval, distance = get_texture_distance(object, startval, endval)
+    else:
+        distance = get_distance(startval, endval)
 
-                elif endval[i] < 1:
-                    endval[i] = 1
+    options = get_options(kwargs)
+    starttime = get_backend().get_total_time() + options["timeoffset"]
+    handle = AnimationHandle() if options["handle"] else None
 
-    # rewrite endval to distance, all calculations are based on distance
-    try:
-        distance = [endval[0] - startval[0], endval[1] - startval[1]]
-    except Exception:
-        distance = endval - startval
+    register(new_animation(type, object, startval, distance, ease, duration, starttime, options, handle=handle))
+
+    return handle
+
+
+def stagger(items, type, startval, endval, ease, duration, interval, **kwargs):
+    """
+    adds the same animation for many items, each starting interval seconds after the previous one,
+    all items share one sampled curve and are added to animations register only once they are due,
+    staggers have no handle, use subscribe() or the per item callbacks to follow them
+    """
+
+    if kwargs.get("handle"):
+        raise ValueError("stagger() does not support handle=True, use subscribe() or callbacks instead")
+
+    items = list(items)
+    if not items:
+        return
+
+    if type == "size":
+        fix_min_size(items[0], startval, endval)
+
+    duration = int(round(duration))
+    distance = get_distance(startval, endval)
+    options = get_options(kwargs)
+    starttime = get_backend().get_total_time() + options["timeoffset"]
+    curve = sample_curve(ease, duration)
+    next_item = 0
+    ispaused = False
+    pausetime = 0
+
+    entry = [options, type, items, startval, distance, ease, duration, starttime, interval, curve, next_item, ispaused, pausetime]
+
+    global staggers
+    staggers.append(entry)
+    count_unreleased(entry, 1)
+
+
+def count_unreleased(entry, change):
+    """
+    adds the items of a stagger not yet in animations register to counters, change is 1 or -1
+    """
+
+    remaining = (len(entry[2]) - entry[10]) * change
+    counters["paused" if entry[11] else "pending"] += remaining
+    counters["types"][entry[1]] = counters["types"].get(entry[1], 0) + remaining
+
+
+def get_options(kwargs):
+    """
+    returns the animation options, defaults updated by kwargs
+    """
 
     options = {
         "name": "",
@@ -62,11 +443,18 @@ def add(type, object, startval, endval, ease, duration, **kwargs):
         "callback": "",
         "callback_data": "",
         "early_callback": "",
-        "early_callback_data": ""
+        "early_callback_data": "",
+        "handle": False
     }
     options.update(kwargs)
+    return options
+
+
+def new_animation(type, object, startval, distance, ease, duration, starttime, options, curve=None, handle=None, per_item_callbacks=False):
+    """
+    builds a new animation data-set, see run() for the layout
+    """
 
-    starttime = dpg.get_total_time() + options["timeoffset"]
     framecounter = 0
     last_ease = 0
     loopcounter = 0
@@ -74,7 +462,7 @@ def add(type, object, startval, endval, ease, duration, **kwargs):
     ispaused = False
     isreversed = False
 
-    new_animation = [
+    return [
         options["name"],
         type,
         object,
@@ -93,12 +481,12 @@ def add(type, object, startval, endval, ease, duration, **kwargs):
         options["early_callback_data"],
         isplaying,
         ispaused,
-        isreversed
+        isreversed,
+        curve,
+        handle,
+        per_item_callbacks
     ]
 
-    global animations
-    animations.append(new_animation)
-
 
 def run():
     """
@@ -123,22 +511,60 @@ def run():
     animation[16] = isplaying
     animation[17] = ispaused
     animation[18] = isreversed
+    animation[19] = baked curve
+    animation[20] = handle
+    animation[21] = per item callbacks
     """
 
     animations_updated = []
     callbacks = {}
+    resolved = []
+    events = []
     global animations
 
+    if recording is not None:
+        recording.append([])
+
+    counters["finished"] = 0
+
+    if pending_timelines:
+        merge_pending_timelines()
+
+    if staggers:
+        release_staggers()
+
+    if pending_reflows:
+        measure_reflows()
+
+    now = get_backend().get_total_time()
+
+    if culling:
+        refresh_culling(now)
+
     for animation in animations:
 
-        if dpg.get_total_time() >= animation[7] and not animation[17]:
+        if now >= animation[7] and not animation[17]:
 
             if animation[14] and animation[8] == 0:
-                callbacks[animation[14]] = (animation[2], animation[15])
+                key = (animation[14], animation[2]) if animation[21] else animation[14]
+                callbacks[key] = (animation[14], animation[2], animation[15])
+
+            if not animation[16]:
+                counters["pending"] -= 1
+                counters["active"] += 1
+
+                if subscribers:
+                    events.append(("started", animation))
+
+                if animation[20]:
+                    resolved.append((animation[20].started, animation[2]))
 
             animation[16] = True
-            frame = animation[8] / animation[6]
-            ease = BezierTransistion(frame, animation[5])
+            if animation[19] is not None:
+                ease = animation[19][animation[8]]
+            else:
+                frame = animation[8] / animation[6]
+                ease = BezierTransistion(frame, animation[5])
 
             if animation[1] == "position":
                 add_delta_positions(animation, ease)
@@ -149,6 +575,12 @@ def run():
             elif animation[1] == "opacity":
                 add_delta_opacities(animation, ease)
 
+            elif animation[1] == "series":
+                add_delta_series(animation, ease)
+
+            elif animation[1] == "texture":
+                blend_texture(animation, ease)
+
             animation[9] = ease
 
             if animation[8] < animation[6]:
@@ -166,8 +598,25 @@ def run():
                 if animation[10]:
                     set_loop(animation, animations_updated)
 
+                    if subscribers:
+                        events.append(("looped", animation))
+
+                    if animation[20]:
+                        resolved.append((animation[20].looped, animation[11]))
+                        animation[20].looped = Future()
+                else:
+                    unregister(animation)
+                    counters["finished"] += 1
+
+                    if subscribers:
+                        events.append(("finished", animation))
+
+                    if animation[20]:
+                        resolved.append((animation[20].finished, animation[2]))
+
                 if animation[12]:
-                    callbacks[animation[12]] = (animation[2], animation[13])
+                    key = (animation[12], animation[2]) if animation[21] else animation[12]
+                    callbacks[key] = (animation[12], animation[2], animation[13])
 
         else:
             animations_updated.append(animation)
@@ -176,10 +625,27 @@ def run():
     set_size()
     set_opacity()
 
+    if delta_series:
+        set_series()
+
     animations = animations_updated
 
-    for func, dat in callbacks.items():
-        func(dat[0], dat[1])
+    # staggered items share one callback function, they are fired per item
+    for func, object, data in callbacks.values():
+        if recording is not None:
+            record("callback", object, getattr(func, "__qualname__", repr(func)))
+        func(object, data)
+
+    for future, result in resolved:
+        if not future.done():
+            future.set_result(result)
+
+    for event, animation in events:
+        emit(event, animation)
+
+    if deleted_items:
+        drop_items(deleted_items)
+        deleted_items.clear()
 
 
 def play(animation_name):
@@ -190,8 +656,21 @@ def play(animation_name):
     global animations
 
     for animation in animations:
-        if animation[0] == animation_name:
+        if animation[0] == animation_name and animation[17]:
+            counters["paused"] -= 1
             animation[17] = False
+            counters[get_state(animation)] += 1
+
+            if subscribers:
+                emit("resumed", animation)
+
+    # the remaining items of a stagger keep their spacing, shifted by the paused time
+    for entry in staggers:
+        if entry[0]["name"] == animation_name and entry[11]:
+            count_unreleased(entry, -1)
+            entry[7] += get_backend().get_total_time() - entry[12]
+            entry[11] = False
+            count_unreleased(entry, 1)
 
 
 def pause(animation_name):
@@ -202,8 +681,20 @@ def pause(animation_name):
     global animations
 
     for animation in animations:
-        if animation[0] == animation_name:
+        if animation[0] == animation_name and not animation[17]:
+            counters[get_state(animation)] -= 1
             animation[17] = True
+            counters["paused"] += 1
+
+            if subscribers:
+                emit("paused", animation)
+
+    for entry in staggers:
+        if entry[0]["name"] == animation_name and not entry[11]:
+            count_unreleased(entry, -1)
+            entry[11] = True
+            entry[12] = get_backend().get_total_time()
+            count_unreleased(entry, 1)
 
 
 def remove(animation_name):
@@ -212,48 +703,119 @@ def remove(animation_name):
     """
 
     animations_updated = []
-    delta_positions_updated = []
-    delta_sizes_updated = []
-    delta_opacities_updated = []
-    object_anitype = []
     global animations
-    global delta_positions
-    global delta_sizes
-    global delta_opacities
+    global staggers
+
+    staggers_updated = []
+    for entry in staggers:
+        if not entry[0]["name"] == animation_name:
+            staggers_updated.append(entry)
+        else:
+            count_unreleased(entry, -1)
+    staggers = staggers_updated
 
     for animation in animations:
         if not animation[0] == animation_name:
             animations_updated.append(animation)
         else:
-            object_anitype = [animation[2], animation[1]]
-
-    if object_anitype:
-        found = False
-        for ani in animations_updated:
-            if ani[2] == object_anitype[0] and ani[1] == object_anitype[1]:
-                found = True
-                break
+            unregister(animation)
+            cancel_handle(animation)
 
-        if not found:
-            if object_anitype[1] == "position":
-                for entry in delta_positions:
-                    if not entry[0] == object_anitype[0]:
-                        delta_positions_updated.append(entry)
-                delta_positions = delta_positions_updated
-
-            elif object_anitype[1] == "size":
-                for entry in delta_sizes:
-                    if not entry[0] == object_anitype[0]:
-                        delta_sizes_updated.append(entry)
-                delta_sizes = delta_sizes_updated
-
-            elif object_anitype[1] == "opacity":
-                for entry in delta_opacities:
-                    if not entry[0] == object_anitype[0]:
-                        delta_opacities_updated.append(entry)
-                delta_opacities = delta_opacities_updated
+            if subscribers:
+                emit("removed", animation)
 
     animations = animations_updated
+    evict_deltas()
+
+
+def set_alpha_pool(steps=64):
+    """
+    fades non-text items by binding them to a pool of shared themes with steps alpha levels
+    instead of one theme per item, items are only rebound when their level changes,
+    the pooled theme replaces the theme bound to the item until a fade leaves it fully
+    opaque again, then the item's own theme is bound back, 0 disables the pool
+    """
+
+    global alpha_pool_steps
+
+    if steps != 0 and steps < 2:
+        raise ValueError("alpha pool needs at least 2 steps, got " + str(steps))
+
+    gui = get_backend()
+    for item in list(item_themes):
+        if gui.does_item_exist(item):
+            restore_item_theme(gui, item)
+    item_themes.clear()
+
+    alpha_pool_steps = int(steps)
+    alpha_themes.clear()
+    alpha_buckets.clear()
+
+
+def reflow(container, change, ease, duration, **kwargs):
+    """
+    animates the children of a container from their old to their new layout position,
+    change() is called to alter the layout, new positions are measured once dearpygui
+    rendered a frame, only moved children are animated and get back to auto layout
+    when finished, the measured frame shows the new layout once before the children
+    snap back to their old positions
+    """
+
+    gui = get_backend()
+    positions = {}
+
+    for child in gui.get_item_children(container):
+        positions[child] = list(gui.get_item_pos(child))
+
+    change()
+
+    pending_reflows.append([container, positions, ease, int(round(duration)), get_options(kwargs), gui.get_frame_count()])
+
+
+def subscribe(func):
+    """
+    calls func(event, animation name, object) whenever an animation is started, looped,
+    finished, paused, resumed or removed
+    """
+
+    subscribers.append(func)
+
+
+def unsubscribe(func):
+    """
+    stops calling func on state changes
+    """
+
+    subscribers.remove(func)
+
+
+def add_raw_texture(width, height, parent, **kwargs):
+    """
+    adds a raw texture backed by a preallocated float32 rgba buffer,
+    texture animations blend into this buffer in place
+    """
+
+    import numpy as np
+
+    buffer = np.zeros(width * height * 4, dtype=np.float32)
+    texture = get_backend().add_raw_texture(width, height, buffer, parent, **kwargs)
+
+    texture_buffers[texture] = buffer
+    return texture
+
+
+def prune():
+    """
+    drops all animations of items that no longer exist
+    """
+
+    gui = get_backend()
+    items = set()
+
+    for animation in animations:
+        items.add(animation[2])
+
+    drop_items([item for item in items if not gui.does_item_exist(item)])
 
 
 def get(*args):
@@ -279,10 +841,15 @@ def get(*args):
                 return_data.append(animation[3])
 
             if entry == "endval":
-                try:
-                    endval = [animation[3][0] + animation[4][0], animation[3][1] + animation[4][1]]
-                except Exception:
+                if animation[1] == "series":
+                    endval = [animation[3][0] if animation[4][0] is None else animation[3][0] + animation[4][0], animation[3][1] + animation[4][1]]
+                elif animation[1] == "texture":
                     endval = animation[3] + animation[4]
+                else:
+                    try:
+                        endval = [animation[3][0] + animation[4][0], animation[3][1] + animation[4][1]]
+                    except Exception:
+                        endval = animation[3] + animation[4]
                 return_data.append(endval)
 
             if entry == "ease":
@@ -359,78 +926,389 @@ def BezierTransistion(search, handles):
     return 3 * t * (1 - t) ** 2 * h1y + 3 * t ** 2 * (1 - t) * h2y + t ** 3
 
 
-def set_loop(animation, animations_updated):
+def get_series_distance(series, startval, endval):
     """
-    prepare animation for next loop iteration
+    converts start and end of a plot series to numpy arrays, values are either y
+    or [x, y], x is taken from the series and not animated if only y is given
     """
 
-    if animation[10] == "ping-pong":
-        animation[18] = True
-        animation[8] -= 1
-        animation[9] = 1
-
-    elif animation[10] == "cycle":
-        animation[8] = 0
-        animation[9] = 0
+    import numpy as np
 
-    elif animation[10] == "continue":
-        try:
-            animation[3] = [animation[3][0] + animation[4][0], animation[3][1] + animation[4][1]]
-        except Exception:
-            animation[3] += animation[4]
-        animation[8] = 0
-        animation[9] = 0
+    if len(startval) == 2 and hasattr(startval[0], "__len__"):
+        start_x = np.array(startval[0], dtype=np.float64)
+        start_y = np.array(startval[1], dtype=np.float64)
+        distance_x = np.asarray(endval[0], dtype=np.float64) - start_x
+        end_y = np.asarray(endval[1], dtype=np.float64)
+    else:
+        start_x = np.array(get_backend().get_item_value(series)[0], dtype=np.float64)
+        start_y = np.array(startval, dtype=np.float64)
+        distance_x = None
+        end_y = np.asarray(endval, dtype=np.float64)
 
-    animation[11] += 1
-    animations_updated.append(animation)
+    return [start_x, start_y], [distance_x, end_y - start_y]
 
 
-def add_delta_positions(animation, ease):
+def get_texture_distance(texture, startval, endval):
     """
-    collects delta movements of all position animations for a certain item
+    converts both images of a texture cross-fade to flat float32 arrays
     """
 
-    global delta_positions
+    import numpy as np
 
-    for item in delta_positions:
-        if animation[2] == item[0]:
+    if texture not in texture_buffers:
+        raise ValueError("texture '" + str(texture) + "' was not created by add_raw_texture()")
 
-            x_step = animation[4][0] * (ease - animation[9])
-            y_step = animation[4][1] * (ease - animation[9])
+    start = np.array(startval, dtype=np.float32).reshape(-1)
+    end = np.asarray(endval, dtype=np.float32).reshape(-1)
 
-            item[1] += x_step
-            item[2] += y_step
+    if start.size != texture_buffers[texture].size or end.size != start.size:
+        raise ValueError("images do not match the size of texture '" + str(texture) + "'")
 
-            if animation[8] < animation[6] or animation[10]:
-                item[3] = True
+    return start, end - start
 
-            if animation[10] == "cycle" and animation[8] == animation[6]:
-                item[3] = False
 
-            if animation[8] == animation[6] and not item[3]:
-                item[3] = False
+def register(animation):
+    """
+    adds an animation data-set to animations register and counts its reference on the items delta
+    """
 
-            break
-    else:
-        delta_positions.append([animation[2], animation[3][0], animation[3][1], True])
+    key = (animation[1], animation[2])
+    delta_refs[key] = delta_refs.get(key, 0) + 1
+    animations.append(animation)
 
+    counters[get_state(animation)] += 1
+    counters["types"][animation[1]] = counters["types"].get(animation[1], 0) + 1
 
-def add_delta_sizes(animation, ease):
+
+def unregister(animation):
     """
-    collects delta movements of all size animations for a certain item
+    releases the reference of an animation data-set leaving animations register
     """
 
-    global delta_sizes
+    key = (animation[1], animation[2])
+    if delta_refs[key] == 1:
+        del delta_refs[key]
 
-    for item in delta_sizes:
-        if animation[2] == item[0]:
-            w_step = animation[4][0] * (ease - animation[9])
-            h_step = animation[4][1] * (ease - animation[9])
+        # the last fade of an item is done, forget its pooled alpha level
+        # and give a fully opaque item its own theme back
+        if animation[1] == "opacity":
+            bucket = alpha_buckets.pop(animation[2], None)
+            if bucket == alpha_pool_steps - 1 and animation[2] in item_themes:
+                restore_item_theme(get_backend(), animation[2])
+    else:
+        delta_refs[key] -= 1
 
-            item[1] += w_step
-            item[2] += h_step
+    counters[get_state(animation)] -= 1
+    counters["types"][animation[1]] -= 1
 
-            if animation[8] < animation[6] or animation[10]:
+
+def get_state(animation):
+    """
+    returns the counter an animation data-set is counted in
+    """
+
+    if animation[17]:
+        return "paused"
+    elif animation[16]:
+        return "active"
+    else:
+        return "pending"
+
+
+def emit(event, animation):
+    """
+    passes a state change to all subscribers
+    """
+
+    for func in subscribers:
+        func(event, animation[0], animation[2])
+
+
+def cancel_handle(animation):
+    """
+    cancels the pending futures of a removed animations handle
+    """
+
+    if animation[20]:
+        animation[20].started.cancel()
+        animation[20].finished.cancel()
+        animation[20].looped.cancel()
+
+
+def evict_deltas():
+    """
+    drops delta entries no animation refers to anymore
+    """
+
+    global delta_positions
+    global delta_sizes
+    global delta_opacities
+    global delta_series
+
+    delta_positions = [entry for entry in delta_positions if ("position", entry[0]) in delta_refs]
+    delta_sizes = [entry for entry in delta_sizes if ("size", entry[0]) in delta_refs]
+    delta_opacities = [entry for entry in delta_opacities if ("opacity", entry[0]) in delta_refs]
+    delta_series = [entry for entry in delta_series if ("series", entry[0]) in delta_refs]
+
+
+def drop_items(items):
+    """
+    drops all animations and delta entries of the given items in one pass
+    """
+
+    global animations
+
+    items = set(items)
+    if not items:
+        return
+
+    animations_updated = []
+
+    for animation in animations:
+        if animation[2] in items:
+            unregister(animation)
+            cancel_handle(animation)
+
+            if subscribers:
+                emit("removed", animation)
+        else:
+            animations_updated.append(animation)
+
+    animations = animations_updated
+    evict_deltas()
+
+    for item in items:
+        alpha_buckets.pop(item, None)
+        item_themes.pop(item, None)
+
+
+def fix_min_size(object, startval, endval):
+    """
+    fix min-values: smallest size window = 32x32, smallest size item = 1x1
+    """
+
+    if get_backend().get_item_type(object) == "mvAppItemType::Window":
+        for i in range(2):
+            if startval[i] < 32:
+                startval[i] = 32
+
+            elif endval[i] < 32:
+                endval[i] = 32
+    else:
+        for i in range(2):
+            if startval[i] < 1:
+                startval[i] = 1
+
+            elif endval[i] < 1:
+                endval[i] = 1
+
+
+def get_distance(startval, endval):
+    """
+    rewrite endval to distance, all calculations are based on distance
+    """
+
+    try:
+        return [endval[0] - startval[0], endval[1] - startval[1]]
+    except Exception:
+        return endval - startval
+
+
+def measure_reflows():
+    """
+    measures the new layout of reflowed containers after a rendered frame,
+    moved children are added as one group of position animations sharing a curve
+    """
+
+    global pending_reflows
+
+    gui = get_backend()
+    reflows_updated = []
+    frame = gui.get_frame_count()
+    now = gui.get_total_time()
+
+    for entry in pending_reflows:
+        container, positions, ease, duration, options, reflow_frame = entry
+
+        if frame <= reflow_frame:
+            reflows_updated.append(entry)
+            continue
+
+        moved = []
+        for child in gui.get_item_children(container):
+            old = positions.get(child)
+            if old is None:
+                continue
+
+            new = list(gui.get_item_pos(child))
+            if new != old:
+                moved.append((child, old, get_distance(old, new)))
+
+        if not moved:
+            continue
+
+        curve = sample_curve(ease, duration)
+        starttime = now + options["timeoffset"]
+        children = [child for child, old, distance in moved]
+        group_options = dict(options, loop="", callback="", callback_data="")
+
+        group = []
+        for child, old, distance in moved:
+            group.append(new_animation("position", child, old, distance, ease, duration, starttime, group_options, curve))
+            group_options = dict(group_options, early_callback="", early_callback_data="")
+
+        # the first child resets all children to auto layout once the group finished
+        group[0][12] = reflow_finished(container, children, options)
+
+        for animation in group:
+            register(animation)
+
+    pending_reflows = reflows_updated
+
+
+def reflow_finished(container, children, options):
+    """
+    returns the callback that puts reflowed children back to auto layout
+    """
+
+    def callback(sender, data):
+        gui = get_backend()
+
+        for child in children:
+            if gui.does_item_exist(child):
+                gui.reset_item_pos(child)
+
+        if options["callback"]:
+            options["callback"](container, options["callback_data"])
+
+    return callback
+
+
+def release_staggers():
+    """
+    adds the items of staggered animations that are due to animations register
+
+    Stagger data-set layout:
+
+    stagger[0] = options
+    stagger[1] = animation type
+    stagger[2] = items
+    stagger[3] = start value
+    stagger[4] = distance
+    stagger[5] = ease
+    stagger[6] = duration
+    stagger[7] = starttime
+    stagger[8] = interval
+    stagger[9] = shared curve
+    stagger[10] = next item
+    stagger[11] = ispaused
+    stagger[12] = pause time
+    """
+
+    global staggers
+
+    staggers_updated = []
+    now = get_backend().get_total_time()
+
+    for entry in staggers:
+        if not entry[11]:
+            items = entry[2]
+            while entry[10] < len(items):
+                starttime = entry[7] + entry[10] * entry[8]
+                if now < starttime:
+                    break
+
+                # the item was counted as pending since stagger(), register counts it again
+                counters["pending"] -= 1
+                counters["types"][entry[1]] -= 1
+                register(new_animation(entry[1], items[entry[10]], entry[3], entry[4], entry[5], entry[6], starttime, entry[0], entry[9], per_item_callbacks=True))
+                entry[10] += 1
+
+        if entry[10] < len(entry[2]):
+            staggers_updated.append(entry)
+
+    staggers = staggers_updated
+
+
+def set_loop(animation, animations_updated):
+    """
+    prepare animation for next loop iteration
+    """
+
+    if animation[10] == "ping-pong":
+        animation[18] = True
+        animation[8] -= 1
+        animation[9] = 1
+
+    elif animation[10] == "cycle":
+        animation[8] = 0
+        animation[9] = 0
+
+    elif animation[10] == "continue":
+        if animation[1] == "series":
+            if animation[4][0] is not None:
+                animation[3][0] += animation[4][0]
+            animation[3][1] += animation[4][1]
+        elif animation[1] == "texture":
+            animation[3] += animation[4]
+        else:
+            try:
+                animation[3] = [animation[3][0] + animation[4][0], animation[3][1] + animation[4][1]]
+            except Exception:
+                animation[3] += animation[4]
+        animation[8] = 0
+        animation[9] = 0
+
+    animation[11] += 1
+    animations_updated.append(animation)
+
+
+def add_delta_positions(animation, ease):
+    """
+    collects delta movements of all position animations for a certain item
+    """
+
+    global delta_positions
+
+    for item in delta_positions:
+        if animation[2] == item[0]:
+
+            x_step = animation[4][0] * (ease - animation[9])
+            y_step = animation[4][1] * (ease - animation[9])
+
+            item[1] += x_step
+            item[2] += y_step
+
+            if animation[8] < animation[6] or animation[10]:
+                item[3] = True
+
+            if animation[10] == "cycle" and animation[8] == animation[6]:
+                item[3] = False
+
+            if animation[8] == animation[6] and not item[3]:
+                item[3] = False
+
+            break
+    else:
+        delta_positions.append([animation[2], animation[3][0], animation[3][1], True])
+
+
+def add_delta_sizes(animation, ease):
+    """
+    collects delta movements of all size animations for a certain item
+    """
+
+    global delta_sizes
+
+    for item in delta_sizes:
+        if animation[2] == item[0]:
+            w_step = animation[4][0] * (ease - animation[9])
+            h_step = animation[4][1] * (ease - animation[9])
+
+            item[1] += w_step
+            item[2] += h_step
+
+            if animation[8] < animation[6] or animation[10]:
                 item[3] = True
 
             if animation[10] == "cycle" and animation[8] == animation[6]:
@@ -471,6 +1349,55 @@ def add_delta_opacities(animation, ease):
         delta_opacities.append([animation[2], animation[3], True])
 
 
+def add_delta_series(animation, ease):
+    """
+    collects delta movements of all series animations for a certain plot series,
+    in place on preallocated buffers
+    """
+
+    import numpy as np
+
+    global delta_series
+
+    for item in delta_series:
+        if animation[2] == item[0]:
+            step = ease - animation[9]
+
+            if animation[4][0] is not None:
+                np.multiply(animation[4][0], step, out=item[3])
+                np.add(item[1], item[3], out=item[1])
+
+            np.multiply(animation[4][1], step, out=item[3])
+            np.add(item[2], item[3], out=item[2])
+
+            if animation[8] < animation[6] or animation[10]:
+                item[4] = True
+
+            if animation[10] == "cycle" and animation[8] == animation[6]:
+                item[4] = False
+
+            if animation[8] == animation[6] and not item[4]:
+                item[4] = False
+
+            break
+    else:
+        start_x, start_y = animation[3]
+        delta_series.append([animation[2], start_x.copy(), start_y.copy(), start_y.copy(), True])
+
+
+def blend_texture(animation, ease):
+    """
+    blends both images of a texture cross-fade in place into the textures buffer
+    """
+
+    import numpy as np
+
+    buffer = texture_buffers[animation[2]]
+
+    np.multiply(animation[4], ease, out=buffer)
+    np.add(buffer, animation[3], out=buffer)
+
+
 def set_pos():
     """
     moves the item
@@ -479,10 +1406,12 @@ def set_pos():
     global delta_positions
 
     items_updated = []
+    gui = get_backend()
 
     for item in delta_positions:
         if item[3] is None:
-            items_updated.append(item)
+            if ("position", item[0]) in delta_refs:
+                items_updated.append(item)
             continue
 
         elif item[3]:
@@ -497,7 +1426,20 @@ def set_pos():
             x_int = round(item[1])
             y_int = round(item[2])
 
-        dpg.set_item_pos(item[0], [x_int, y_int])
+        try:
+            if culling and is_culled("position", item[0], gui):
+                culled_writes[("position", item[0])] = [x_int, y_int]
+                continue
+
+            gui.set_item_pos(item[0], [x_int, y_int])
+        except Exception:
+            if gui.does_item_exist(item[0]):
+                raise
+            deleted_items.add(item[0])
+            continue
+
+        if recording is not None:
+            record("position", item[0], [x_int, y_int])
 
     delta_positions = items_updated
 
@@ -510,10 +1452,12 @@ def set_size():
     global delta_sizes
 
     items_updated = []
+    gui = get_backend()
 
     for item in delta_sizes:
         if item[3] is None:
-            items_updated.append(item)
+            if ("size", item[0]) in delta_refs:
+                items_updated.append(item)
             continue
 
         elif item[3]:
@@ -528,39 +1472,26 @@ def set_size():
             w_int = round(item[1])
             h_int = round(item[2])
 
-        dpg.set_item_width(item[0], w_int)
-        dpg.set_item_height(item[0], h_int)
+        try:
+            if culling and is_culled("size", item[0], gui):
+                culled_writes[("size", item[0])] = [w_int, h_int]
+                continue
+
+            gui.set_item_size(item[0], [w_int, h_int])
+        except Exception:
+            if gui.does_item_exist(item[0]):
+                raise
+            deleted_items.add(item[0])
+            continue
+
+        if recording is not None:
+            record("size", item[0], [w_int, h_int])
 
     delta_sizes = items_updated
 
 
 def dpg_get_alpha_style(item):
-    theme = dpg.get_item_theme(item)
-    if theme is None:
-        theme = dpg.add_theme()
-        theme_component = dpg.add_theme_component(dpg.mvAll, parent=theme)
-        alpha_style = dpg.add_theme_style(dpg.mvStyleVar_Alpha, 1, category=dpg.mvThemeCat_Core, parent=theme_component)
-        dpg.bind_item_theme(item, theme)
-        return alpha_style
-
-    all_components = dpg.get_item_children(theme, 1)
-    theme_component = None
-    for component in all_components:
-        if dpg.get_item_configuration(component)['item_type'] == dpg.mvAll:
-            theme_component = component
-            break
-    if theme_component is None:
-        theme_component = dpg.add_theme_component(parent=theme)
-
-    all_styles = dpg.get_item_children(theme_component, 1)
-    alpha_style = None
-    for style in all_styles:
-        if dpg.get_item_configuration(style)['target'] == dpg.mvStyleVar_Alpha:
-            alpha_style = style
-            break
-    if alpha_style is None:
-        alpha_style = dpg.add_theme_style(dpg.mvStyleVar_Alpha, 1, category=dpg.mvThemeCat_Core, parent=theme_component)
-    return alpha_style
+    return get_backend().get_alpha_style(item)
 
 
 def set_opacity():
@@ -571,24 +1502,745 @@ def set_opacity():
     global delta_opacities
 
     items_updated = []
+    gui = get_backend()
 
     for item in delta_opacities:
         if item[2] is None:
-            items_updated.append(item)
+            if ("opacity", item[0]) in delta_refs:
+                items_updated.append(item)
             continue
 
         elif item[2]:
             item[2] = None
             items_updated.append(item)
 
-        if dpg.get_item_type(item[0]) == "mvAppItemType::mvText":
-            new_color = dpg.get_item_configuration(item[0])["color"]
-            new_color = list(map(lambda color: int(color * 255), new_color[:3:]))
+        try:
+            if culling:
+                if is_culled("opacity", item[0], gui):
+                    culled_writes[("opacity", item[0])] = item[1]
+                    continue
 
-            new_color.append(item[1] * 255)
+                # the item scrolled back into view before the next refresh
+                culled_writes.pop(("opacity", item[0]), None)
 
-            dpg.configure_item(item[0], color=new_color)
-        else:
-            dpg.set_value(dpg_get_alpha_style(item[0]), [item[1]])
+            write_opacity(gui, item[0], item[1])
+        except Exception:
+            if gui.does_item_exist(item[0]):
+                raise
+            deleted_items.add(item[0])
+            continue
+
+        if recording is not None:
+            record("opacity", item[0], float(item[1]))
 
     delta_opacities = items_updated
+
+
+def write_opacity(gui, item, opacity):
+    """
+    writes an items opacity, through the shared alpha themes if the pool is enabled
+    """
+
+    if not alpha_pool_steps:
+        gui.set_item_opacity(item, opacity)
+        return
+
+    bucket = alpha_buckets.get(item, -1)
+
+    # the final write of a finished fade lands after it was unregistered
+    fading = ("opacity", item) in delta_refs
+
+    # text items keep their own color based fading
+    if bucket == -1 and gui.get_item_type(item) == "mvAppItemType::mvText":
+        bucket = None
+        if fading:
+            alpha_buckets[item] = None
+
+    if bucket is None:
+        gui.set_item_opacity(item, opacity)
+        return
+
+    new_bucket = round(min(max(opacity, 0), 1) * (alpha_pool_steps - 1))
+
+    # a fade that ends fully opaque needs no pooled theme, the item's own theme is bound back
+    if not fading and new_bucket == alpha_pool_steps - 1:
+        if item in item_themes:
+            restore_item_theme(gui, item)
+        return
+
+    if new_bucket == bucket:
+        return
+
+    theme = alpha_themes.get(new_bucket)
+    if theme is None:
+        theme = alpha_themes[new_bucket] = gui.add_alpha_theme(new_bucket / (alpha_pool_steps - 1))
+
+    if item not in item_themes:
+        item_themes[item] = gui.get_item_theme(item)
+
+    gui.bind_item_theme(item, theme)
+    if fading:
+        alpha_buckets[item] = new_bucket
+
+
+def restore_item_theme(gui, item):
+    """
+    binds the theme an item had before its first pooled alpha theme back
+    """
+
+    gui.bind_item_theme(item, item_themes.pop(item))
+    alpha_buckets.pop(item, None)
+
+
+def set_series():
+    """
+    set plot series values, one write per series
+    """
+
+    global delta_series
+
+    items_updated = []
+    gui = get_backend()
+
+    for item in delta_series:
+        if item[4] is None:
+            if ("series", item[0]) in delta_refs:
+                items_updated.append(item)
+            continue
+
+        elif item[4]:
+            item[4] = None
+            items_updated.append(item)
+
+        try:
+            gui.set_item_series(item[0], item[1], item[2])
+        except Exception:
+            if gui.does_item_exist(item[0]):
+                raise
+            deleted_items.add(item[0])
+            continue
+
+    delta_series = items_updated
+
+
+# -----------------------------------------------------------------------------
+# 				Baked Timelines
+# -----------------------------------------------------------------------------
+
+# baked file layout (little-endian):
+#
+# header  = magic "DPGA", version (u16), reserved (u16, always 0), curve count (u32),
+#           entry count (u32), samples offset (u32)
+# entries = type, loop, tag kind, dims, curve index, duration, timeoffset,
+#           start value (dims * double), distance (dims * double),
+#           tag (u16 length + utf-8), name (u16 length + utf-8)
+# curves  = curve count * (first sample, sample count)
+# samples = float32 eased progress per frame, shared by all entries of a curve
+
+BAKE_MAGIC = b"DPGA"
+BAKE_VERSION = 1
+BAKE_HEADER = struct.Struct("<4sHHIII")
+BAKE_ENTRY = struct.Struct("<BBBBIId")
+BAKE_CURVE = struct.Struct("<II")
+BAKE_TYPES = ["position", "size", "opacity"]
+BAKE_LOOPS = ["", "ping-pong", "cycle", "continue"]
+
+
+def pack_string(value):
+    """
+    packs a value as u16 length prefixed utf-8 string
+    """
+
+    value = str(value).encode()
+    return struct.pack("<H", len(value)) + value
+
+
+def unpack_string(data, offset):
+    """
+    unpacks a u16 length prefixed utf-8 string, returns string and next offset
+    """
+
+    length, = struct.unpack_from("<H", data, offset)
+    return bytes(data[offset + 2:offset + 2 + length]).decode(), offset + 2 + length
+
+
+def sample_curve(ease, duration):
+    """
+    samples the eased progress of a bezier curve for every frame
+    """
+
+    duration = int(duration)
+    return array("f", [BezierTransistion(frame / duration, ease) for frame in range(duration + 1)])
+
+
+def bake(filename, *animation_names):
+    """
+    bakes registered animations into a memory-mappable timeline file,
+    all animations are baked if no names are given, only animations that
+    have not started yet and are not paused can be baked
+    """
+
+    global animations
+
+    now = get_backend().get_total_time()
+    curves = {}
+    samples = array("f")
+    curve_table = []
+    entries = []
+
+    for animation in animations:
+        if animation_names and animation[0] not in animation_names:
+            continue
+
+        if animation[1] not in BAKE_TYPES:
+            raise ValueError("animation type '" + str(animation[1]) + "' cannot be baked")
+
+        # a baked entry has no frame, loop or direction state, it always starts over
+        if animation[16] or animation[17] or animation[8] or animation[11]:
+            raise ValueError("animation '" + str(animation[0]) + "' already started or is paused and cannot be baked")
+
+        duration = int(round(animation[6]))
+
+        if animation[19] is not None:
+            curve = array("f", animation[19])
+        else:
+            curve = sample_curve(animation[5], duration)
+
+        # identical curves are stored only once
+        key = curve.tobytes()
+        if key not in curves:
+            curves[key] = len(curve_table)
+            curve_table.append((len(samples), len(curve)))
+            samples.extend(curve)
+
+        tag_kind = 0 if isinstance(animation[2], int) else 1
+
+        if animation[1] == "opacity":
+            values = [animation[3], animation[4]]
+        else:
+            values = [animation[3][0], animation[3][1], animation[4][0], animation[4][1]]
+
+        entries.append(
+            BAKE_ENTRY.pack(
+                BAKE_TYPES.index(animation[1]),
+                BAKE_LOOPS.index(animation[10]),
+                tag_kind,
+                len(values) // 2,
+                curves[key],
+                duration,
+                max(animation[7] - now, 0)
+            )
+            + struct.pack("<" + str(len(values)) + "d", *values)
+            + pack_string(animation[2])
+            + pack_string(animation[0])
+        )
+
+    body = b"".join(entries) + b"".join(BAKE_CURVE.pack(*curve) for curve in curve_table)
+    padding = -(BAKE_HEADER.size + len(body)) % 4
+    samples_offset = BAKE_HEADER.size + len(body) + padding
+
+    if sys.byteorder == "big":
+        samples.byteswap()
+
+    with open(filename, "wb") as file:
+        file.write(BAKE_HEADER.pack(BAKE_MAGIC, BAKE_VERSION, 0, len(curve_table), len(entries), samples_offset))
+        file.write(body)
+        file.write(b"\0" * padding)
+        file.write(samples.tobytes())
+
+
+def load(filename, timeoffset=0):
+    """
+    memory-maps a baked timeline file and adds its animations to animations register,
+    baked animations play back their sampled curves without solving any easing
+    """
+
+    with open(filename, "rb") as file:
+        data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    magic, version, _, curve_count, entry_count, samples_offset = BAKE_HEADER.unpack_from(data, 0)
+    if magic != BAKE_MAGIC or version != BAKE_VERSION:
+        raise ValueError("'" + str(filename) + "' is not a baked timeline")
+
+    if sys.byteorder == "big":
+        samples = array("f", data[samples_offset:])
+        samples.byteswap()
+    else:
+        samples = memoryview(data)[samples_offset:].cast("f")
+
+    offset = BAKE_HEADER.size
+    baked = []
+    for i in range(entry_count):
+        type, loop, tag_kind, dims, curve, duration, delay = BAKE_ENTRY.unpack_from(data, offset)
+        offset += BAKE_ENTRY.size
+
+        values = struct.unpack_from("<" + str(dims * 2) + "d", data, offset)
+        offset += dims * 16
+
+        tag, offset = unpack_string(data, offset)
+        name, offset = unpack_string(data, offset)
+
+        if tag_kind == 0:
+            tag = int(tag)
+
+        if dims == 1:
+            startval, distance = values
+        else:
+            startval = [values[0], values[1]]
+            distance = [values[2], values[3]]
+
+        baked.append((BAKE_TYPES[type], BAKE_LOOPS[loop], tag, name, startval, distance, curve, duration, delay))
+
+    curve_table = [BAKE_CURVE.unpack_from(data, offset + i * BAKE_CURVE.size) for i in range(curve_count)]
+    curves = [samples[first:first + count] for first, count in curve_table]
+
+    options = get_options({})
+    now = get_backend().get_total_time() + timeoffset
+
+    for type, loop, tag, name, startval, distance, curve, duration, delay in baked:
+        options["name"] = name
+        options["loop"] = loop
+        register(new_animation(type, tag, startval, distance, None, duration, now + delay, options, curves[curve]))
+
+
+# -----------------------------------------------------------------------------
+# 				Recording
+# -----------------------------------------------------------------------------
+
+# recording file layout (little-endian):
+#
+# header  = magic "DPGR", version, frame count, tag count
+# tags    = tag count * (tag kind, u16 length + utf-8)
+# frames  = frame count * (entry count, entries)
+# entries = op, tag index, value
+#           position / size = 2 * int32, opacity = double, callback = u16 length + utf-8
+
+RECORD_MAGIC = b"DPGR"
+RECORD_VERSION = 1
+RECORD_HEADER = struct.Struct("<4sHII")
+RECORD_OPS = ["position", "size", "opacity", "callback"]
+RECORD_TARGET_METHODS = {
+    "position": "set_item_pos",
+    "size": "set_item_size",
+    "opacity": "set_item_opacity",
+    "callback": "fire_callback"
+}
+
+
+def record_start():
+    """
+    starts recording every write and callback issued by run(), one entry list per frame
+    """
+
+    global recording
+    recording = []
+
+
+def record_stop():
+    """
+    stops recording and returns the recorded frames
+    """
+
+    global recording
+    frames = recording
+    recording = None
+    return frames
+
+
+def record(op, item, value):
+    """
+    adds a write to the current frame of the recording
+    """
+
+    recording[-1].append((op, item, value))
+
+
+def replay_frame(frame, target=None):
+    """
+    feeds one recorded frame back into the active backend, or into a target providing
+    set_item_pos, set_item_size, set_item_opacity and fire_callback
+    """
+
+    if target is None:
+        target = get_backend()
+
+    for op, item, value in frame:
+        getattr(target, RECORD_TARGET_METHODS[op])(item, value)
+
+
+def replay(frames, target=None):
+    """
+    replays a recording, one frame each time the returned iterator is advanced
+    """
+
+    for index, frame in enumerate(frames):
+        replay_frame(frame, target)
+        yield index
+
+
+def diff_recordings(frames_a, frames_b):
+    """
+    compares two recordings frame by frame,
+    returns (frame index, only in a, only in b) for every frame that differs
+    """
+
+    differences = []
+
+    for index in range(max(len(frames_a), len(frames_b))):
+        frame_a = frames_a[index] if index < len(frames_a) else []
+        frame_b = frames_b[index] if index < len(frames_b) else []
+
+        entries_a = sorted(map(repr, frame_a))
+        entries_b = sorted(map(repr, frame_b))
+
+        if entries_a != entries_b:
+            only_a = [entry for entry in frame_a if repr(entry) not in entries_b]
+            only_b = [entry for entry in frame_b if repr(entry) not in entries_a]
+            differences.append((index, only_a, only_b))
+
+    return differences
+
+
+def save_recording(frames, filename):
+    """
+    writes a recording to a compact binary file
+    """
+
+    tags = {}
+    body = []
+
+    for frame in frames:
+        body.append(struct.pack("<I", len(frame)))
+
+        for op, item, value in frame:
+            key = (isinstance(item, int), str(item))
+            if key not in tags:
+                tags[key] = len(tags)
+
+            body.append(struct.pack("<BI", RECORD_OPS.index(op), tags[key]))
+
+            if op == "opacity":
+                body.append(struct.pack("<d", value))
+            elif op == "callback":
+                body.append(pack_string(value))
+            else:
+                body.append(struct.pack("<ii", value[0], value[1]))
+
+    with open(filename, "wb") as file:
+        file.write(RECORD_HEADER.pack(RECORD_MAGIC, RECORD_VERSION, len(frames), len(tags)))
+        for is_int, tag in tags:
+            file.write(struct.pack("<B", 0 if is_int else 1) + pack_string(tag))
+        file.write(b"".join(body))
+
+
+def load_recording(filename):
+    """
+    reads a recording written by save_recording()
+    """
+
+    with open(filename, "rb") as file:
+        data = file.read()
+
+    magic, version, frame_count, tag_count = RECORD_HEADER.unpack_from(data, 0)
+    if magic != RECORD_MAGIC or version != RECORD_VERSION:
+        raise ValueError("'" + str(filename) + "' is not a recording")
+
+    offset = RECORD_HEADER.size
+    tags = []
+    for i in range(tag_count):
+        kind = data[offset]
+        tag, offset = unpack_string(data, offset + 1)
+        tags.append(int(tag) if kind == 0 else tag)
+
+    frames = []
+    for i in range(frame_count):
+        entry_count, = struct.unpack_from("<I", data, offset)
+        offset += 4
+        frame = []
+
+        for j in range(entry_count):
+            op, tag = struct.unpack_from("<BI", data, offset)
+            op = RECORD_OPS[op]
+            offset += 5
+
+            if op == "opacity":
+                value, = struct.unpack_from("<d", data, offset)
+                offset += 8
+            elif op == "callback":
+                value, offset = unpack_string(data, offset)
+            else:
+                value = list(struct.unpack_from("<ii", data, offset))
+                offset += 8
+
+            frame.append((op, tags[tag], value))
+
+        frames.append(frame)
+
+    return frames
+
+
+# -----------------------------------------------------------------------------
+# 				Timeline Compilation
+# -----------------------------------------------------------------------------
+
+# timeline description:
+#
+# tracks = [
+#     {
+#         "object": item,
+#         "type": "position" | "size" | "opacity",
+#         "name": animation name (optional),
+#         "ease": default ease (optional),
+#         "keyframes": [[time in seconds, value, ease (optional)], ...]
+#     },
+#     ...
+# ]
+#
+# the ease of a keyframe is used for the segment leading to it
+
+
+def compile_timeline(tracks, fps=60, chunksize=16, executor=None):
+    """
+    compiles a timeline description into segments and sampled curves in a process pool,
+    returns a future of the compiled timeline
+    """
+
+    global timeline_executor
+
+    if executor is None:
+        if timeline_executor is None:
+            timeline_executor = ProcessPoolExecutor()
+        executor = timeline_executor
+
+    tracks = list(tracks)
+    timeline = Future()
+    chunks = [executor.submit(compile_tracks, tracks[i:i + chunksize], fps) for i in range(0, len(tracks), chunksize)]
+    pending = [len(chunks)]
+    lock = threading.Lock()
+
+    # done callbacks of a thread pool run concurrently on its workers
+    def chunk_done(chunk):
+        with lock:
+            pending[0] -= 1
+            last = pending[0] == 0
+
+        if last:
+            try:
+                timeline.set_result([segment for chunk in chunks for segment in chunk.result()])
+            except Exception as error:
+                timeline.set_exception(error)
+
+    if not chunks:
+        timeline.set_result([])
+
+    for chunk in chunks:
+        chunk.add_done_callback(chunk_done)
+
+    return timeline
+
+
+def add_timeline(tracks, fps=60, timeoffset=0, executor=None):
+    """
+    compiles a timeline description in a process pool, run() merges it into
+    animations register once compiled, timeoffset counts from the merge
+    """
+
+    timeline = compile_timeline(tracks, fps, executor=executor)
+    pending_timelines.append([timeline, timeoffset])
+    return timeline
+
+
+def merge(timeline, timeoffset=0):
+    """
+    adds all animations of a compiled timeline to animations register in one step
+    """
+
+    starttime = get_backend().get_total_time() + timeoffset
+    options = get_options({})
+    curves = {}
+
+    for type, object, name, startval, distance, duration, delay, curve in timeline:
+        curve = curves.setdefault(curve.tobytes(), curve)
+        options["name"] = name
+        register(new_animation(type, object, startval, distance, None, duration, starttime + delay, options, curve))
+
+
+def merge_pending_timelines():
+    """
+    merges all compiled timelines added by add_timeline(),
+    failed compilations are dropped, their error stays on the returned future
+    """
+
+    global pending_timelines
+
+    timelines_updated = []
+
+    for entry in pending_timelines:
+        if not entry[0].done():
+            timelines_updated.append(entry)
+
+        elif not entry[0].cancelled() and entry[0].exception() is None:
+            merge(entry[0].result(), entry[1])
+
+    pending_timelines = timelines_updated
+
+
+def compile_tracks(tracks, fps):
+    """
+    compiles tracks of a timeline description into segments,
+    runs in a worker process
+    """
+
+    segments = []
+    curves = {}
+
+    for track in tracks:
+        keyframes = sorted(track["keyframes"], key=lambda keyframe: keyframe[0])
+        ease = track.get("ease", [0, 0, 1, 1])
+
+        for previous, keyframe in zip(keyframes, keyframes[1:]):
+            duration = max(1, round((keyframe[0] - previous[0]) * fps))
+            segment_ease = tuple(keyframe[2] if len(keyframe) > 2 else ease)
+
+            key = (segment_ease, duration)
+            if key not in curves:
+                curves[key] = sample_curve(segment_ease, duration)
+
+            segments.append((
+                track["type"],
+                track["object"],
+                track.get("name", ""),
+                previous[1],
+                get_distance(previous[1], keyframe[1]),
+                duration,
+                previous[0],
+                curves[key]
+            ))
+
+    return segments
+
+
+# -----------------------------------------------------------------------------
+# 				Visibility Culling
+# -----------------------------------------------------------------------------
+
+def set_culling(enabled, refresh=0.25):
+    """
+    enables skipping writes to items in hidden or collapsed windows and to
+    scrolled out items, their animations keep running and the current value
+    is written once the item is visible again, windows are checked every frame,
+    scrolled out items every refresh seconds
+    """
+
+    global culling
+    global culling_refresh
+    global culling_checked
+
+    culling = enabled
+    culling_refresh = refresh
+    culling_checked = None
+
+    if not enabled:
+        flush_culled_writes(True)
+
+
+def is_culled(type, item, gui):
+    """
+    returns whether writes to an item are skipped, position and size are only
+    culled with their window as they can move the item back into view,
+    opacity is also culled for shown items clipped or scrolled out of their window
+    """
+
+    window = item_windows.get(item)
+    if window is None:
+        window = item
+        parent = gui.get_item_parent(window)
+        while parent is not None:
+            window = parent
+            parent = gui.get_item_parent(window)
+        item_windows[item] = window
+
+    state = get_window_state(window, gui)
+
+    if window == item:
+        return not state[0]
+
+    if not state[1]:
+        return True
+
+    if type != "opacity":
+        return False
+
+    # hidden items are still written so showing and fading them in starts at the right alpha
+    visible = visible_items.get(item)
+    if visible is None:
+        visible = visible_items[item] = not gui.is_item_shown(item) or gui.is_item_visible(item)
+    return not visible
+
+
+def get_window_state(window, gui):
+    """
+    returns whether a window is shown and whether its content is visible, cached for one frame
+    """
+
+    state = visible_windows.get(window)
+    if state is None:
+        shown = gui.is_item_shown(window)
+        state = visible_windows[window] = (shown, shown and gui.is_item_visible(window))
+    return state
+
+
+def refresh_culling(now):
+    """
+    checks the windows seen last frame again, drops cached item visibility every
+    refresh seconds and writes the values of items visible again
+    """
+
+    global culling_checked
+
+    gui = get_backend()
+    changed = False
+
+    # windows are few, a window shown again is written on its first visible frame
+    last_states = list(visible_windows.items())
+    visible_windows.clear()
+    for window, state in last_states:
+        if gui.does_item_exist(window) and get_window_state(window, gui) != state:
+            changed = True
+
+    if culling_checked is None or now - culling_checked >= culling_refresh:
+        culling_checked = now
+        item_windows.clear()
+        visible_items.clear()
+        changed = True
+
+    if changed and culled_writes:
+        flush_culled_writes(False)
+
+
+def flush_culled_writes(all_items):
+    """
+    writes the last culled value of every item no longer culled
+    """
+
+    gui = get_backend()
+
+    for key, value in list(culled_writes.items()):
+        type, item = key
+
+        try:
+            if not all_items and is_culled(type, item, gui):
+                continue
+
+            if type == "opacity":
+                write_opacity(gui, item, value)
+            else:
+                getattr(gui, RECORD_TARGET_METHODS[type])(item, value)
+        except Exception:
+            if gui.does_item_exist(item):
+                raise
+
+        del culled_writes[key]
+
+        if recording:
+            record(type, item, value)
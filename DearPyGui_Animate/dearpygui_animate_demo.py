@@ -24,19 +24,7 @@ def onUpdate():
 
 
 def update_running_animations():
-    playing = animate.get("isplaying")
-
-    if playing:
-        running = 0
-
-        for play in playing:
-            if play:
-                running += 1
-
-        dpg.set_value("running_animations", "animations running: " + str(running))
-
-    else:
-        dpg.set_value("running_animations", "animations running: 0")
+    dpg.set_value("running_animations", "animations running: " + str(animate.counters["active"]))
 
 
 # -----------------------------------------------------------------------------
@@ -46,9 +34,7 @@ def update_running_animations():
 def show_buttons(sender, data):
     # shorthand to unhide items before running animation
     animate.add("opacity", "Info", 0, 1, [.64, .12, .72, .86], 20, timeoffset=10 / 60)
-    animate.add("opacity", "Animate Position", 0, 1, [.64, .12, .72, .86], 20, timeoffset=15 / 60, early_callback=lambda sender, data: dpg.show_item("Animate Position"))
-    animate.add("opacity", "Animate Size", 0, 1, [.64, .12, .72, .86], 20, timeoffset=20 / 60, early_callback=lambda sender, data: dpg.show_item("Animate Size"))
-    animate.add("opacity", "Animate Opacity", 0, 1, [.64, .12, .72, .86], 20, timeoffset=25 / 60, early_callback=lambda sender, data: dpg.show_item("Animate Opacity"))
+    animate.stagger(["Animate Position", "Animate Size", "Animate Opacity"], "opacity", 0, 1, [.64, .12, .72, .86], 20, 5 / 60, timeoffset=15 / 60, early_callback=lambda sender, data: dpg.show_item(sender))
 
 
 def gotoDemo(data):